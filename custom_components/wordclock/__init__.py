@@ -1,16 +1,14 @@
 """The WordClock integration."""
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 
-from .coordinator import WordClockCoordinator
+from .coordinator import WordClockConfigEntry, WordClockCoordinator
 
-DOMAIN = "wordclock"
 PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.NUMBER, Platform.SELECT, Platform.SWITCH]
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: WordClockConfigEntry) -> bool:
     """Set up WordClock from a config entry."""
     host = entry.data[CONF_HOST]
     name = entry.data[CONF_NAME]
@@ -18,27 +16,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create coordinator
     coordinator = WordClockCoordinator(hass, host, name)
 
-    # Store coordinator in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Store coordinator on the config entry
+    entry.runtime_data = coordinator
 
-    # Start SSE listener
-    await coordinator.async_start()
+    # Stop SSE listener on unload
+    entry.async_on_unload(coordinator.async_stop)
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    try:
+        # Start SSE listener
+        await coordinator.async_start()
+
+        # Set up platforms
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        # Home Assistant doesn't run on_unload callbacks for every setup
+        # failure, make sure the SSE listener doesn't leak
+        await coordinator.async_stop()
+        raise
     return True
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: WordClockConfigEntry) -> bool:
     """Unload a config entry."""
-    # Stop SSE listener
-    coordinator: WordClockCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.async_stop()
-
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
\ No newline at end of file
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
\ No newline at end of file
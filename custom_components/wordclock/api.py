@@ -0,0 +1,32 @@
+"""HTTP helpers for the WordClock API."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+
+REQUEST_TIMEOUT = 5  # seconds
+
+
+class WordClockConnectionError(Exception):
+    """Error to indicate the WordClock could not be reached."""
+
+
+async def async_request(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    *,
+    timeout: float = REQUEST_TIMEOUT,
+    **kwargs: Any,
+) -> tuple[int, bytes]:
+    """Send a request to the WordClock and return the status and body."""
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.request(method, url, **kwargs) as response:
+                return response.status, await response.read()
+    except TimeoutError as err:
+        raise WordClockConnectionError(f"Timeout requesting {url}") from err
+    except aiohttp.ClientError as err:
+        raise WordClockConnectionError(f"Error requesting {url}: {err}") from err
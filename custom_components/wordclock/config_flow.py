@@ -1,12 +1,9 @@
 """Config flow for WordClock integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
-import aiohttp
-import async_timeout
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -14,7 +11,9 @@ from homeassistant.components import zeroconf
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
+from .api import WordClockConnectionError, async_request
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,17 +41,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle zeroconf discovery."""
         # Use hostname instead of IP for reliability across IP changes
         hostname = discovery_info.hostname.rstrip(".")
-        
+
+        # Check for existing entries with the same hostname first, so that
+        # rediscovery of a configured clock doesn't hit the network
+        await self.async_set_unique_id(hostname)
+        self._abort_if_unique_id_configured()
+
         # Check if this device is a WordClock by testing the /status endpoint
         try:
-            info = await validate_input(self.hass, {CONF_HOST: hostname})
+            await validate_input(self.hass, {CONF_HOST: hostname})
         except CannotConnect:
             return self.async_abort(reason="cannot_connect")
-        
-        # Check for existing entries with the same hostname
-        await self.async_set_unique_id(hostname)
-        self._abort_if_unique_id_configured()
-        
+
         self._discovered_host = hostname
         return await self.async_step_discovery_confirm()
 
@@ -110,12 +110,13 @@ async def validate_input(hass, data: dict[str, Any]) -> dict[str, Any]:
     session = async_get_clientsession(hass)
 
     try:
-        async with async_timeout.timeout(10):
-            async with session.get(f"http://{host}/status") as response:
-                if response.status != 200:
-                    raise CannotConnect
-                await response.json()
-    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        status, payload = await async_request(
+            session, "GET", f"http://{host}/status", timeout=10
+        )
+        if status != 200:
+            raise CannotConnect
+        json_loads(payload)
+    except (WordClockConnectionError, ValueError) as err:
         raise CannotConnect from err
 
     return {"title": data.get(CONF_NAME, "WordClock")}
\ No newline at end of file
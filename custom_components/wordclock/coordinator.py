@@ -3,18 +3,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any
 
 import aiohttp
-import async_timeout
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
+
+from .api import WordClockConnectionError, async_request
 
 _LOGGER = logging.getLogger(__name__)
 
-RECONNECT_DELAY = 5  # seconds
+RECONNECT_DELAY_MIN = 1  # seconds
+RECONNECT_DELAY_MAX = 60  # seconds
+UPDATE_COOLDOWN = 0.1  # seconds
+SSE_CONNECT_TIMEOUT = 10  # seconds
+SSE_READ_TIMEOUT = 45  # seconds, must exceed the device's keep-alive interval
+
+SSE_HEADERS = {
+    "Accept": "text/event-stream",
+    "Cache-Control": "no-cache",
+}
+# No total timeout, but detect a silently dropped connection
+SSE_TIMEOUT = aiohttp.ClientTimeout(
+    total=None,
+    sock_connect=SSE_CONNECT_TIMEOUT,
+    sock_read=SSE_READ_TIMEOUT,
+)
 
 
 class WordClockCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -27,24 +47,38 @@ class WordClockCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"WordClock {name}",
             update_interval=None,  # We don't use polling, only SSE events
+            always_update=False,
         )
         self._host = host
         self._session: aiohttp.ClientSession = async_get_clientsession(hass)
         self._sse_task: asyncio.Task | None = None
         self._shutdown = False
+        self._reconnect_delay = RECONNECT_DELAY_MIN
+        self._sse_update: dict[str, Any] | None = None
+        self._pending_update: dict[str, Any] = {}
+        self._send_task: asyncio.Task | None = None
+        self._update_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_start_sender,
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint (fallback method)."""
         try:
-            async with async_timeout.timeout(5):
-                async with self._session.get(f"http://{self._host}/status") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    raise UpdateFailed(f"Error fetching data: {response.status}")
-        except asyncio.TimeoutError as err:
-            raise UpdateFailed("Timeout fetching data") from err
-        except aiohttp.ClientError as err:
+            status, payload = await async_request(
+                self._session, "GET", f"http://{self._host}/status"
+            )
+        except WordClockConnectionError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        if status != 200:
+            raise UpdateFailed(f"Error fetching data: {status}")
+        try:
+            return json_loads(payload)
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid data from API: {err}") from err
 
     async def async_start(self) -> None:
         """Start the SSE listener."""
@@ -56,7 +90,7 @@ class WordClockCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._sse_task = asyncio.create_task(self._listen_sse())
 
     async def async_stop(self) -> None:
-        """Stop the SSE listener."""
+        """Stop the SSE listener and any pending update."""
         self._shutdown = True
         if self._sse_task:
             self._sse_task.cancel()
@@ -65,55 +99,83 @@ class WordClockCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except asyncio.CancelledError:
                 pass
             self._sse_task = None
+        self._sse_update = None
+
+        # Drop updates that have not been sent yet
+        self._update_debouncer.async_shutdown()
+        self._pending_update = {}
+        if self._send_task:
+            self._send_task.cancel()
+            try:
+                await self._send_task
+            except asyncio.CancelledError:
+                pass
+            self._send_task = None
 
     async def _listen_sse(self) -> None:
         """Listen to Server-Sent Events from the wordclock."""
+        connected = False
+        # Reconnects after an idle read timeout are routine, keep them quiet
+        log_level = logging.INFO
         while not self._shutdown:
             try:
-                _LOGGER.info("Connecting to SSE endpoint at http://%s/events", self._host)
+                _LOGGER.log(log_level, "Connecting to SSE endpoint at http://%s/events", self._host)
                 async with self._session.get(
                     f"http://{self._host}/events",
-                    headers={
-                        "Accept": "text/event-stream",
-                        "Cache-Control": "no-cache",
-                    },
-                    timeout=aiohttp.ClientTimeout(total=None),  # No timeout for SSE
+                    headers=SSE_HEADERS,
+                    timeout=SSE_TIMEOUT,
                 ) as response:
                     if response.status != 200:
+                        delay = self._next_reconnect_delay()
                         _LOGGER.warning(
-                            "SSE connection failed with status %s, retrying in %s seconds",
+                            "SSE connection failed with status %s, retrying in %.1f seconds",
                             response.status,
-                            RECONNECT_DELAY,
+                            delay,
                         )
-                        await asyncio.sleep(RECONNECT_DELAY)
+                        await asyncio.sleep(delay)
                         continue
 
-                    _LOGGER.info("Successfully connected to WordClock SSE stream at %s", self._host)
+                    _LOGGER.log(
+                        log_level, "Successfully connected to WordClock SSE stream at %s", self._host
+                    )
+                    log_level = logging.INFO
+                    if connected:
+                        # Pick up changes made while the stream was down
+                        await self.async_request_refresh()
+                    connected = True
 
                     # Read SSE stream line by line
                     event_type = None
                     event_data = None
+                    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                    received = False
 
                     async for line in response.content:
                         if self._shutdown:
                             break
 
-                        line = line.decode("utf-8").rstrip("\r\n")
+                        # Only a stream that delivers data counts as recovered
+                        if not received:
+                            received = True
+                            self._reconnect_delay = RECONNECT_DELAY_MIN
 
-                        _LOGGER.debug("SSE raw line: %r", line)
+                        if debug:
+                            _LOGGER.debug("SSE raw line: %r", line)
 
                         # Empty line signals end of event
-                        if not line:
+                        if line in (b"\n", b"\r\n"):
                             if event_data:
                                 try:
-                                    import json
-                                    data = json.loads(event_data)
-                                    _LOGGER.info("Received SSE event (type=%s): %s", event_type, data)
+                                    data = json_loads(event_data)
+                                    if debug:
+                                        _LOGGER.debug(
+                                            "Received SSE event (type=%s): %s", event_type, data
+                                        )
 
                                     # Update coordinator data and notify listeners
-                                    self.async_set_updated_data(data)
+                                    self._async_queue_sse_update(data)
 
-                                except json.JSONDecodeError as err:
+                                except ValueError as err:
                                     _LOGGER.warning("Failed to parse SSE data: %s - Data was: %s", err, event_data)
 
                                 # Reset for next event
@@ -121,51 +183,125 @@ class WordClockCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                                 event_data = None
                             continue
 
-                        # Parse SSE fields
-                        if line.startswith("event:"):
-                            event_type = line[6:].strip()
-                        elif line.startswith("data:"):
+                        # Parse SSE fields, JSON payloads are decoded straight from bytes
+                        if line.startswith(b"data:"):
                             event_data = line[5:].strip()
+                        elif line.startswith(b"event:"):
+                            event_type = line[6:].strip().decode("utf-8")
 
+                # The WordClock closed the stream, don't reconnect in a tight loop
+                if not self._shutdown:
+                    delay = self._next_reconnect_delay()
+                    _LOGGER.info(
+                        "SSE stream closed by WordClock, reconnecting in %.1f seconds", delay
+                    )
+                    await asyncio.sleep(delay)
+
+            except aiohttp.SocketTimeoutError:
+                _LOGGER.debug(
+                    "No data on SSE stream for %s seconds, reconnecting", SSE_READ_TIMEOUT
+                )
+                log_level = logging.DEBUG
             except aiohttp.ClientError as err:
+                log_level = logging.INFO
                 if not self._shutdown:
+                    delay = self._next_reconnect_delay()
                     _LOGGER.warning(
-                        "SSE connection error: %s, retrying in %s seconds",
+                        "SSE connection error: %s, retrying in %.1f seconds",
                         err,
-                        RECONNECT_DELAY,
+                        delay,
                     )
-                    await asyncio.sleep(RECONNECT_DELAY)
+                    await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 _LOGGER.debug("SSE listener cancelled")
                 raise
             except Exception as err:
                 if not self._shutdown:
                     _LOGGER.exception("Unexpected error in SSE listener: %s", err)
-                    await asyncio.sleep(RECONNECT_DELAY)
+                    await asyncio.sleep(self._next_reconnect_delay())
 
         _LOGGER.debug("SSE listener stopped")
 
-    async def async_send_update(self, data: dict[str, Any]) -> bool:
-        """Send update to WordClock."""
-        try:
-            async with async_timeout.timeout(5):
-                async with self._session.post(
+    @callback
+    def _async_queue_sse_update(self, data: dict[str, Any]) -> None:
+        """Queue state received over SSE.
+
+        Events that are already buffered are read without yielding to the
+        event loop, so publishing on the next loop iteration merges a burst
+        of events into a single listener update.
+        """
+        if self._sse_update is None:
+            self._sse_update = data
+            self.hass.loop.call_soon(self._async_publish_sse_update)
+        else:
+            self._sse_update.update(data)
+
+    @callback
+    def _async_publish_sse_update(self) -> None:
+        """Notify listeners about the queued SSE state."""
+        data, self._sse_update = self._sse_update, None
+        if data is None:
+            return
+        # Skip state writes when the device only repeats the current state
+        if self.last_update_success and data == self.data:
+            return
+        self.async_set_updated_data(data)
+
+    def _next_reconnect_delay(self) -> float:
+        """Return the next reconnect delay using exponential backoff with jitter."""
+        delay = self._reconnect_delay * (0.5 + random.random())
+        self._reconnect_delay = min(RECONNECT_DELAY_MAX, self._reconnect_delay * 2)
+        return delay
+
+    async def async_send_update(self, data: dict[str, Any]) -> None:
+        """Queue an update for the WordClock.
+
+        Updates arriving in quick succession (e.g. while dragging a slider)
+        are merged and sent as a single request.
+        """
+        self._pending_update.update(data)
+
+        # SSE will update us, but we can optimistically update to avoid UI lag.
+        # Only do so on top of known good state, async_set_updated_data would
+        # otherwise mark an unreachable clock as available.
+        if self.last_update_success and self.data is not None:
+            updated_data = self.data.copy()
+            updated_data.update(data)
+            self.async_set_updated_data(updated_data)
+
+        await self._update_debouncer.async_call()
+
+    @callback
+    def _async_start_sender(self) -> None:
+        """Start sending pending changes unless a sender is already running."""
+        if self._shutdown or (self._send_task and not self._send_task.done()):
+            return
+        self._send_task = self.hass.async_create_task(self._async_send_pending())
+
+    async def _async_send_pending(self) -> None:
+        """Send all pending changes to WordClock.
+
+        Changes queued while a request is in flight are sent right after it.
+        """
+        while self._pending_update and not self._shutdown:
+            data, self._pending_update = self._pending_update, {}
+            try:
+                status, _ = await async_request(
+                    self._session,
+                    "POST",
                     f"http://{self._host}/update",
                     json=data,
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    if response.status == 200:
-                        # SSE will update us, but we can optimistically update
-                        # to avoid UI lag
-                        current_data = self.data or {}
-                        updated_data = {**current_data, **data}
-                        self.async_set_updated_data(updated_data)
-                        return True
-                    _LOGGER.warning("Failed to update WordClock: HTTP %s", response.status)
-                    return False
-        except asyncio.TimeoutError:
-            _LOGGER.info("WordClock at %s not responding to update", self._host)
-            return False
-        except aiohttp.ClientError as err:
-            _LOGGER.info("Cannot send update to WordClock at %s: %s", self._host, err)
-            return False
+                )
+            except WordClockConnectionError as err:
+                _LOGGER.info("Cannot send update to WordClock at %s: %s", self._host, err)
+            else:
+                if status == 200:
+                    continue
+                _LOGGER.warning("Failed to update WordClock: HTTP %s", status)
+
+            # Discard the optimistic state of the failed batch and resync with
+            # the device, without holding up changes queued in the meantime
+            self.hass.async_create_task(self.async_request_refresh())
+
+
+WordClockConfigEntry = ConfigEntry[WordClockCoordinator]
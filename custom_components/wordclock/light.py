@@ -10,25 +10,23 @@ from homeassistant.components.light import (
     ColorMode,
     LightEntity,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
-from .coordinator import WordClockCoordinator
+from .coordinator import WordClockConfigEntry, WordClockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: WordClockConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the WordClock Light platform."""
-    coordinator: WordClockCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
     name = config_entry.data[CONF_NAME]
 
     async_add_entities([WordClockLight(coordinator, name)])
@@ -37,21 +35,34 @@ async def async_setup_entry(
 class WordClockLight(CoordinatorEntity, LightEntity):
     """Representation of a WordClock Light."""
 
+    _attr_color_mode = ColorMode.RGB
+    _attr_supported_color_modes = {ColorMode.RGB}
+
     def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
         """Initialize a WordClock Light."""
         super().__init__(coordinator)
-        self._name = name
+        self._attr_name = name
+        self._attr_unique_id = f"{coordinator._host}_wordclock"
         self._last_brightness = 128  # Store last brightness (in range 1-255)
 
-    @property
-    def name(self) -> str:
-        """Return the display name of this light."""
-        return self._name
+    async def async_added_to_hass(self) -> None:
+        """Sync last brightness with the coordinator when added to hass."""
+        await super().async_added_to_hass()
+        self._update_last_brightness()
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock"
+    def _update_last_brightness(self) -> None:
+        """Remember the brightness to restore when turning on."""
+        if self.coordinator.data is None:
+            return
+        brightness = self.coordinator.data.get("brightness", 0)
+        if brightness > 0:
+            self._last_brightness = brightness
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_last_brightness()
+        super()._handle_coordinator_update()
 
     @property
     def brightness(self) -> int | None:
@@ -59,10 +70,7 @@ class WordClockLight(CoordinatorEntity, LightEntity):
         if self.coordinator.data is None:
             return None
         # WordClock uses 1-255 range, same as HA
-        brightness = self.coordinator.data.get("brightness", 0)
-        if brightness > 0:
-            self._last_brightness = brightness
-        return brightness
+        return self.coordinator.data.get("brightness", 0)
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
@@ -82,16 +90,6 @@ class WordClockLight(CoordinatorEntity, LightEntity):
             return None
         return self.coordinator.data.get("enabled", self.brightness and self.brightness > 0)
 
-    @property
-    def color_mode(self) -> str:
-        """Return the color mode of the light."""
-        return ColorMode.RGB
-
-    @property
-    def supported_color_modes(self) -> set[str]:
-        """Flag supported color modes."""
-        return {ColorMode.RGB}
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
@@ -5,25 +5,23 @@ import logging
 from typing import Any
 
 from homeassistant.components.number import NumberEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
-from .coordinator import WordClockCoordinator
+from .coordinator import WordClockConfigEntry, WordClockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: WordClockConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the WordClock Number platform."""
-    coordinator: WordClockCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
     name = config_entry.data[CONF_NAME]
 
     async_add_entities([WordClockTransitionSpeed(coordinator, name)])
@@ -32,20 +30,15 @@ async def async_setup_entry(
 class WordClockTransitionSpeed(CoordinatorEntity, NumberEntity):
     """Representation of WordClock transition speed control."""
 
+    _attr_native_min_value = 0
+    _attr_native_max_value = 4
+    _attr_native_step = 1
+
     def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        self._name = name
-
-    @property
-    def name(self) -> str:
-        """Return the display name."""
-        return f"{self._name} Transition Speed"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock_transition_speed"
+        self._attr_name = f"{name} Transition Speed"
+        self._attr_unique_id = f"{coordinator._host}_wordclock_transition_speed"
 
     @property
     def native_value(self) -> float | None:
@@ -54,21 +47,6 @@ class WordClockTransitionSpeed(CoordinatorEntity, NumberEntity):
             return None
         return self.coordinator.data.get("transitionSpeed")
 
-    @property
-    def native_min_value(self) -> float:
-        """Return the minimum value."""
-        return 0
-
-    @property
-    def native_max_value(self) -> float:
-        """Return the maximum value."""
-        return 4
-
-    @property
-    def native_step(self) -> float:
-        """Return the step value."""
-        return 1
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         data = {"transitionSpeed": int(value)}
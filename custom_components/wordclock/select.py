@@ -1,201 +1,139 @@
 """Platform for select integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 import logging
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.components.select import SelectEntity
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
-from .coordinator import WordClockCoordinator
+from .coordinator import WordClockConfigEntry, WordClockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-TRANSITION_OPTIONS = {
+# Read-only, shared by reference with the select entity descriptions
+TRANSITION_OPTIONS = MappingProxyType({
     0: "None",
     1: "Fade",
     2: "Wipe",
     3: "Sparkle"
-}
+})
 
-PREFIX_MODE_OPTIONS = {
+PREFIX_MODE_OPTIONS = MappingProxyType({
     0: "Always",
     1: "Random",
     2: "Off"
-}
+})
 
-LANGUAGE_OPTIONS = {
+LANGUAGE_OPTIONS = MappingProxyType({
     "dialekt": "Dialekt",
     "deutsch": "Deutsch"
-}
+})
+
+
+@dataclass(frozen=True, kw_only=True)
+class WordClockSelectEntityDescription(SelectEntityDescription):
+    """Describes a WordClock select entity, keyed by its WordClock data key."""
+
+    value_options: Mapping[Any, str]
+    name_suffix: str
+    unique_id_suffix: str
+
+
+SELECT_TYPES: tuple[WordClockSelectEntityDescription, ...] = (
+    WordClockSelectEntityDescription(
+        key="transition",
+        value_options=TRANSITION_OPTIONS,
+        name_suffix="Transition",
+        unique_id_suffix="transition",
+    ),
+    WordClockSelectEntityDescription(
+        key="prefixMode",
+        value_options=PREFIX_MODE_OPTIONS,
+        name_suffix="Prefix Mode",
+        unique_id_suffix="prefix_mode",
+    ),
+    WordClockSelectEntityDescription(
+        key="language",
+        value_options=LANGUAGE_OPTIONS,
+        name_suffix="Language",
+        unique_id_suffix="language",
+    ),
+)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: WordClockConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the WordClock Select platform."""
-    coordinator: WordClockCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
     name = config_entry.data[CONF_NAME]
 
-    async_add_entities([
-        WordClockTransitionSelect(coordinator, name),
-        WordClockPrefixModeSelect(coordinator, name),
-        WordClockLanguageSelect(coordinator, name),
-    ])
+    async_add_entities(
+        WordClockSelect(coordinator, name, description) for description in SELECT_TYPES
+    )
 
 
-class WordClockTransitionSelect(CoordinatorEntity, SelectEntity):
-    """Representation of WordClock transition animation selector."""
+class WordClockSelect(CoordinatorEntity, SelectEntity):
+    """Representation of a WordClock setting selector."""
 
-    def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._name = name
-
-    @property
-    def name(self) -> str:
-        """Return the display name."""
-        return f"{self._name} Transition"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock_transition"
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current option."""
-        if self.coordinator.data is None:
-            return None
-        transition_value = self.coordinator.data.get("transition")
-        if transition_value is not None:
-            return TRANSITION_OPTIONS.get(transition_value)
-        return None
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return list(TRANSITION_OPTIONS.values())
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        # Find the key for the selected option
-        transition_value = None
-        for key, value in TRANSITION_OPTIONS.items():
-            if value == option:
-                transition_value = key
-                break
-
-        if transition_value is None:
-            _LOGGER.error("Invalid transition option: %s", option)
-            return
-
-        data = {"transition": transition_value}
-        await self.coordinator.async_send_update(data)
-
-
-class WordClockPrefixModeSelect(CoordinatorEntity, SelectEntity):
-    """Representation of WordClock prefix mode selector."""
+    entity_description: WordClockSelectEntityDescription
 
-    def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
+    def __init__(
+        self,
+        coordinator: WordClockCoordinator,
+        name: str,
+        description: WordClockSelectEntityDescription,
+    ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
-        self._name = name
-
-    @property
-    def name(self) -> str:
-        """Return the display name."""
-        return f"{self._name} Prefix Mode"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock_prefix_mode"
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current option."""
-        if self.coordinator.data is None:
-            return None
-        prefix_mode_value = self.coordinator.data.get("prefixMode")
-        if prefix_mode_value is not None:
-            return PREFIX_MODE_OPTIONS.get(prefix_mode_value)
-        return None
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return list(PREFIX_MODE_OPTIONS.values())
+        self.entity_description = description
+        # Reverse lookup from option label to WordClock value
+        self._values = {label: value for value, label in description.value_options.items()}
+        self._attr_options = list(description.value_options.values())
+        self._attr_name = f"{name} {description.name_suffix}"
+        self._attr_unique_id = f"{coordinator._host}_wordclock_{description.unique_id_suffix}"
+
+    async def async_added_to_hass(self) -> None:
+        """Sync state with the coordinator when added to hass."""
+        await super().async_added_to_hass()
+        self._update_current_option()
+
+    def _update_current_option(self) -> None:
+        """Map the coordinator value to the current option."""
+        data = self.coordinator.data
+        if data is None:
+            self._attr_current_option = None
+        else:
+            description = self.entity_description
+            self._attr_current_option = description.value_options.get(data.get(description.key))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_current_option()
+        super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # Find the key for the selected option
-        prefix_mode_value = None
-        for key, value in PREFIX_MODE_OPTIONS.items():
-            if value == option:
-                prefix_mode_value = key
-                break
-
-        if prefix_mode_value is None:
-            _LOGGER.error("Invalid prefix mode option: %s", option)
+        key = self.entity_description.key
+        value = self._values.get(option)
+        if value is None:
+            _LOGGER.error("Invalid %s option: %s", key, option)
             return
 
-        data = {"prefixMode": prefix_mode_value}
-        await self.coordinator.async_send_update(data)
-
-
-class WordClockLanguageSelect(CoordinatorEntity, SelectEntity):
-    """Representation of WordClock language selector."""
-
-    def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
-        """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._name = name
-
-    @property
-    def name(self) -> str:
-        """Return the display name."""
-        return f"{self._name} Language"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock_language"
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current option."""
-        if self.coordinator.data is None:
-            return None
-        language_value = self.coordinator.data.get("language")
-        if language_value is not None:
-            return LANGUAGE_OPTIONS.get(language_value)
-        return None
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return list(LANGUAGE_OPTIONS.values())
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        # Find the key for the selected option
-        language_value = None
-        for key, value in LANGUAGE_OPTIONS.items():
-            if value == option:
-                language_value = key
-                break
-
-        if language_value is None:
-            _LOGGER.error("Invalid language option: %s", option)
+        # Nothing to send if the option is already active
+        current = self.coordinator.data
+        if current is not None and current.get(key) == value:
             return
 
-        data = {"language": language_value}
+        data = {key: value}
         await self.coordinator.async_send_update(data)
@@ -5,25 +5,26 @@ import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
-from .coordinator import WordClockCoordinator
+from .coordinator import WordClockConfigEntry, WordClockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+ICON_ON = "mdi:lightbulb-on"
+ICON_OFF = "mdi:lightbulb-outline"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: WordClockConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the WordClock Switch platform."""
-    coordinator: WordClockCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
     name = config_entry.data[CONF_NAME]
 
     async_add_entities([WordClockSuperBrightSwitch(coordinator, name)])
@@ -35,36 +36,41 @@ class WordClockSuperBrightSwitch(CoordinatorEntity, SwitchEntity):
     def __init__(self, coordinator: WordClockCoordinator, name: str) -> None:
         """Initialize the switch entity."""
         super().__init__(coordinator)
-        self._name = name
-
-    @property
-    def name(self) -> str:
-        """Return the display name."""
-        return f"{self._name} Super Bright"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self.coordinator._host}_wordclock_superbright"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the switch is on."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get("superBright", False)
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:lightbulb-on" if self.is_on else "mdi:lightbulb-outline"
+        self._attr_name = f"{name} Super Bright"
+        self._attr_unique_id = f"{coordinator._host}_wordclock_superbright"
+
+    async def async_added_to_hass(self) -> None:
+        """Sync state with the coordinator when added to hass."""
+        await super().async_added_to_hass()
+        self._update_state()
+
+    def _update_state(self) -> None:
+        """Update the switch state and icon from coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            self._attr_is_on = None
+        else:
+            self._attr_is_on = data.get("superBright", False)
+        self._attr_icon = ICON_ON if self._attr_is_on else ICON_OFF
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
+        # Only send if Super Bright is not already on
+        if self.is_on:
+            return
         data = {"superBright": True}
         await self.coordinator.async_send_update(data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
+        # Only send if Super Bright is not already off
+        if self.is_on is False:
+            return
         data = {"superBright": False}
         await self.coordinator.async_send_update(data)